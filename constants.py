@@ -0,0 +1,15 @@
+BANNER = r"""
+   _______   __    _____  ___       ___________  _______   ________  ___________  _______   _______   
+  |   __ "\ |" \  (\"   \|"  \     ("     _   ")/"     "| /"       )("     _   ")/"     "| /"      \  
+  (. |__) :)||  | |.\\   \    |     )__/  \\__/(: ______)(:   \___/  )__/  \\__/(: ______)|:        | 
+  |:  ____/ |:  | |: \.   \\  |        \\_ /    \/    |   \___  \       \\_ /    \/    |  |_____/   ) 
+  (|  /     |.  | |.  \    \. |        |.  |    // ___)_   __/  \\      |.  |    // ___)_  //      /  
+ /|__/ \    /\  |\|    \    \ |        \:  |   (:      "| /" \   :)     \:  |   (:      "||:  __   \  
+(_______)  (__\_|_)\___|\____\)         \__|    \_______)(_______/       \__|    \_______)|__|  \___) 
+                                                                                                          
+                                                              
+"""
+
+DESCRIPTION = "Concurrent brute-forcer: 4-digit PIN or dictionary mode — authorized targets only."
+
+DEFAULT_THREADS = 10
